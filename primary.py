@@ -2,15 +2,45 @@ import tkinter as tk  # Import the tkinter library for creating GUI applications
 from tkinter import messagebox, scrolledtext, filedialog, simpledialog, Toplevel, IntVar  # Import specific tkinter # components for enhanced GUI functionality
 from tkinter import ttk  # Import the themed tkinter widgets for a modern look
 import requests  # Import the requests library to handle HTTP requests
+from requests.adapters import HTTPAdapter  # Import HTTPAdapter to size the connection pool for asset downloads
 from bs4 import BeautifulSoup  # Import BeautifulSoup to parse HTML content
 import random  # Import random to select random elements
 import threading  # Import threading to handle tasks in parallel
 import schedule  # Import schedule to manage task scheduling
 import time  # Import time for time-related operations
 import os  # Import os for file and directory operations
+import sys  # Import sys to read command-line arguments
+import socket  # Import socket to name distributed workers after their machine
+import argparse  # Import argparse to parse the worker mode command line
+import atexit  # Import atexit to flush the response cache index on exit
 import glob # Import wildcard file import
+import hashlib  # Import hashlib to build cache keys
+import json  # Import json to persist the response cache index
+import re  # Import re to filter crawled links by pattern
+import sqlite3  # Import sqlite3 to keep crawl frontiers on disk
+from concurrent.futures import ThreadPoolExecutor, Future  # Import ThreadPoolExecutor and Future to run work on threads
+from urllib.parse import urlparse, urljoin, urldefrag  # Import URL helpers to group requests and resolve links
+from collections import OrderedDict  # Import OrderedDict to keep cache entries in least-recently-used order
+from email.utils import parsedate_to_datetime  # Import parsedate_to_datetime to read Expires headers
 from datetime import datetime  # Import datetime to work with dates and times
 from difflib import unified_diff  # Import unified_diff to find differences between two texts
+import csv  # Import csv to append extracted tables to compact CSV files
+
+try:
+    import pyarrow as pa  # Optional: pyarrow writes extracted tables as Parquet
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None  # Without pyarrow, tables are written as CSV
+
+try:
+    import tomllib  # Python 3.11+: read TOML job files
+except ImportError:
+    tomllib = None
+
+try:
+    import yaml  # Optional: PyYAML reads and writes YAML job files
+except ImportError:
+    yaml = None
 
 # Predefined list of common HTML tags to suggest for scraping
 tags = ['p', 'h1', 'h2', 'h3', 'div', 'span', 'a', 'ul', 'li', 'img', 'table']
@@ -42,12 +72,80 @@ previous_content = ""
 max_files = None
 job_name = None
 
+# Directory holding the job folders (snapshots, tables, assets, crawl frontiers); the shared queue's directory
+# when jobs are handed to distributed workers
+data_dir = "."
+
 # Flag to pause active scans
 pause_flag = False
 
 # Dictionary to track the state of each scheduled scan (e.g., running, paused, stopped)
 scans = {}
 
+# Settings of a scan that describe the job itself (as opposed to its runtime state) and can be shared with workers
+job_config_keys = ('url', 'tag', 'selector', 'type', 'cache_ttl', 'timeout', 'retries', 'rate_limit', 'max_depth',
+                   'allowed_domains', 'url_pattern', 'max_pages_per_run', 'output_format', 'strip_tags',
+                   'table_format', 'download_images', 'max_files')
+
+# Shared response cache: page bodies are kept on disk and indexed in memory so that jobs pointing at the same URL
+# (and manual scrapes right after a scheduled run) only hit the network once while the response is fresh
+cache_dir = "./.response_cache"  # Directory holding the cached response bodies and the cache index
+cache_max_bytes = 50 * 1024 * 1024  # Byte budget for cached bodies; least recently used entries are evicted beyond it
+cache_default_ttl = 60  # Seconds a response stays fresh when the server sends no Cache-Control or Expires header
+response_cache = OrderedDict()  # Cache index mapping key -> entry metadata, least recently used first
+response_cache_bytes = 0  # Total size of the cached bodies currently on disk
+cache_flush_interval = 30  # Seconds between writes of the cache index to disk; changes are batched in between
+response_cache_dirty = False  # Whether the in-memory index has changes not yet written to disk
+response_cache_last_flush = 0  # When the index was last written to disk
+response_cache_flush_lock = threading.Lock()  # Lock serialising writes of the index file
+response_cache_lock = threading.Lock()  # Lock guarding the cache index between the GUI and scheduler threads
+response_cache_inflight = {}  # Key -> Future of the fetch in progress, so identical concurrent fetches run once
+
+# Network policy: timeouts, retries with exponential backoff, and a per-host circuit breaker that stops sending
+# requests to an origin that keeps failing until a cool-down period has passed
+request_timeout = (10, 30)  # Connect and read timeouts in seconds; jobs may override them
+max_retries = 3  # Number of retries for retryable errors before giving up
+backoff_base = 0.5  # Base delay in seconds for exponential backoff between retries
+backoff_max = 30  # Upper bound in seconds for a single backoff delay
+retryable_status_codes = {429, 500, 502, 503, 504}  # HTTP status codes worth retrying
+circuit_failure_threshold = 5  # Consecutive failed fetches after which a host's circuit opens
+circuit_cooldown = 300  # Seconds an open circuit rejects requests before letting a trial request through
+host_policies = {}  # Per-host overrides from the "hosts" section of job files, e.g. {'example.com': {'timeout': 5}}
+host_circuits = {}  # Circuit breaker state per host: consecutive failures and when the circuit may close again
+host_circuits_lock = threading.Lock()  # Lock guarding host_circuits between worker threads
+host_next_request = {}  # Earliest time the next request may be sent to each rate-limited host
+host_next_request_lock = threading.Lock()  # Lock guarding host_next_request between worker threads
+
+# Scheduled jobs run on a small pool of worker threads so that one slow job cannot hold up the scheduler
+job_executor = ThreadPoolExecutor(max_workers=4)
+scheduler_thread = None  # Thread running the scheduler loop, started with the first scheduled job
+
+# Asset downloads: images are fetched concurrently over pooled connections and streamed to disk in chunks
+asset_workers = 8  # Number of assets downloaded at the same time
+asset_chunk_size = 64 * 1024  # Bytes read from the network and written to disk at a time
+asset_session = requests.Session()  # Shared session so downloads reuse connections to the same host
+asset_manifest_locks = {}  # Job -> lock serialising updates of the job's asset manifest
+asset_manifest_locks_lock = threading.Lock()  # Lock guarding asset_manifest_locks
+manual_downloads_job = "downloads"  # Folder for images downloaded by hand from the main window
+asset_session.mount("http://", HTTPAdapter(pool_connections=asset_workers, pool_maxsize=asset_workers))
+asset_session.mount("https://", HTTPAdapter(pool_connections=asset_workers, pool_maxsize=asset_workers))
+
+# Distributed mode: when a shared queue is set, scheduled jobs are leased to worker processes (possibly on other
+# machines) instead of running locally. Workers renew their lease with heartbeats; expired leases are reassigned.
+job_queue_path = None  # Path of the shared SQLite queue, e.g. on a network volume; None runs jobs locally
+lease_seconds = 120  # How long a leased job stays assigned to a worker without a heartbeat
+heartbeat_interval = 30  # Seconds between lease renewals while a worker runs a job
+max_job_attempts = 3  # Leases a job may lose (e.g. to crashed workers) before it is marked failed
+worker_poll_interval = 5  # Seconds an idle worker waits before checking the queue again
+queue_retention = 7 * 24 * 3600  # Seconds finished runs stay in the queue after the coordinator has collected them
+queue_last_purge = 0  # When the coordinator last removed old finished runs from the queue
+worker_id = f"{socket.gethostname()}-{os.getpid()}"  # Name this process uses when leasing jobs
+
+
+def job_dir(job):
+    """Return the folder holding a job's snapshots, tables, assets and crawl frontier."""
+    return os.path.join(data_dir, job)
+
 
 def update_last_updated(label):
     """Update the 'Last updated:' label with the current timestamp and change the color to green temporarily."""
@@ -61,6 +159,388 @@ def update_last_updated(label):
     root.after(2000, reset_label_color)  # Change the color back after 2 seconds
 
 
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised when a request is refused because the host's circuit breaker is open."""
+
+
+def check_circuit(host):
+    """Raise CircuitOpenError if requests to the given host are currently being refused."""
+    with host_circuits_lock:
+        circuit = host_circuits.get(host)
+        if circuit and time.time() < circuit['open_until']:
+            raise CircuitOpenError(f"Circuit open for {host} after {circuit['failures']} consecutive failures; "
+                                   f"retrying after {datetime.fromtimestamp(circuit['open_until']):%H:%M:%S}")
+
+
+def record_host_result(host, success):
+    """Update the circuit breaker for a host after a fetch succeeded or finally failed."""
+    with host_circuits_lock:
+        if success:
+            host_circuits.pop(host, None)  # Any success closes the circuit again
+            return
+        circuit = host_circuits.setdefault(host, {'failures': 0, 'open_until': 0})
+        circuit['failures'] += 1
+        if circuit['failures'] >= circuit_failure_threshold:  # Too many failures: stop sending work to this host
+            circuit['open_until'] = time.time() + circuit_cooldown
+            print(f"Circuit opened for {host} for {circuit_cooldown} seconds")
+
+
+def backoff_delay(attempt, retry_after=None):
+    """Return how long to wait before the next attempt, using exponential backoff with full jitter."""
+    if retry_after is not None and retry_after.isdigit():  # Honour the server's Retry-After when it gives seconds
+        return min(int(retry_after), backoff_max)
+    return random.uniform(0, min(backoff_max, backoff_base * 2 ** attempt))
+
+
+def wait_for_rate_limit(host, rate_limit):
+    """Block until another request may be sent to a host without exceeding rate_limit requests per second."""
+    if not rate_limit:
+        return
+    with host_next_request_lock:  # Reserve the next free slot for this host
+        now = time.time()
+        slot = max(now, host_next_request.get(host, 0))
+        host_next_request[host] = slot + 1 / rate_limit
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def host_policy(url):
+    """Return the per-host settings that apply to a URL, matching the host with or without its port."""
+    parsed = urlparse(url)
+    return host_policies.get(parsed.netloc.lower()) or host_policies.get(parsed.hostname or "", {})
+
+
+def fetch_with_retry(url, headers=None, timeout=None, retries=None, rate_limit=None):
+    """GET a URL with a timeout, retrying retryable errors with backoff and respecting the host's circuit breaker."""
+    host = urlparse(url).netloc
+    policy = host_policy(url)
+    timeout = timeout if timeout is not None else policy.get('timeout', request_timeout)
+    retries = retries if retries is not None else policy.get('retries', max_retries)
+    rate_limit = rate_limit if rate_limit is not None else policy.get('rate_limit')
+
+    check_circuit(host)  # Fail fast when the host is known to be down
+    for attempt in range(retries + 1):
+        wait_for_rate_limit(host, rate_limit)  # Every attempt counts against the host's rate limit
+        try:
+            response = requests.get(url, headers=headers, timeout=timeout)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if attempt == retries:  # Out of retries: count the failure against the host
+                record_host_result(host, False)
+                raise
+            time.sleep(backoff_delay(attempt))
+            continue
+
+        if response.status_code in retryable_status_codes:
+            if attempt < retries:
+                time.sleep(backoff_delay(attempt, response.headers.get('Retry-After')))
+                continue
+            # The server is still failing or throttling us after every retry
+            record_host_result(host, False)
+            return response
+
+        record_host_result(host, True)
+        return response
+
+
+def cache_key(url, headers):
+    """Build the cache key for a URL and the request headers that can vary its response."""
+    vary = "\n".join(f"{name.lower()}:{value}" for name, value in sorted(headers.items()))
+    return hashlib.sha256(f"{url}\n{vary}".encode('utf-8')).hexdigest()
+
+
+def response_lifetime(response):
+    """Return how many seconds a response may be served from the cache, or None if it must not be stored."""
+    if response.headers.get('Vary', '').strip() == '*':  # The response varies on something we cannot key on
+        return None
+
+    directives = {}
+    for directive in response.headers.get('Cache-Control', '').lower().split(','):
+        name, _, value = directive.strip().partition('=')
+        if name:
+            directives[name] = value.strip('"')
+
+    if 'no-store' in directives:  # The server forbids caching this response
+        return None
+    if 'no-cache' in directives:  # Store it, but revalidate before every reuse
+        return 0
+    for name in ('s-maxage', 'max-age'):
+        if name in directives:
+            try:
+                return max(int(directives[name]), 0)
+            except ValueError:
+                pass
+
+    expires = response.headers.get('Expires')
+    if expires:
+        try:
+            return max(parsedate_to_datetime(expires).timestamp() - time.time(), 0)
+        except (TypeError, ValueError):
+            return 0  # An invalid Expires header means the response is already stale
+
+    return cache_default_ttl
+
+
+def load_response_cache():
+    """Load the response cache index from disk so cached pages survive restarts."""
+    global response_cache_bytes
+    atexit.register(save_response_cache_index, True)  # Write pending index changes when the program exits
+    index_path = os.path.join(cache_dir, "index.json")
+    try:
+        with open(index_path, 'r', encoding='utf-8') as file:
+            entries = json.load(file)
+    except (OSError, ValueError):  # No cache yet, or the index is unreadable; start empty
+        return
+
+    with response_cache_lock:
+        response_cache.clear()
+        response_cache_bytes = 0
+        for key, entry in sorted(entries.items(), key=lambda item: item[1].get('last_used', 0)):
+            if os.path.exists(os.path.join(cache_dir, key)):  # Skip entries whose body has gone missing
+                response_cache[key] = entry
+                response_cache_bytes += entry['size']
+        evict_response_cache()
+
+    # Remove bodies stored after the last index write of a run that did not exit cleanly
+    for name in os.listdir(cache_dir):
+        if name not in entries and not name.startswith("index.json"):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def save_response_cache_index(force=False):
+    """Write the response cache index to disk if it changed and the flush interval has passed (or force is set).
+
+    Changes are batched so that storing a page does not rewrite the whole index; the index is copied under the
+    cache lock and written without holding it.
+    """
+    global response_cache_dirty, response_cache_last_flush
+    with response_cache_flush_lock:
+        with response_cache_lock:
+            if not response_cache_dirty:
+                return
+            if not force and time.time() - response_cache_last_flush < cache_flush_interval:
+                return
+            snapshot = {key: dict(entry) for key, entry in response_cache.items()}
+            response_cache_dirty = False
+            response_cache_last_flush = time.time()
+
+        index_path = os.path.join(cache_dir, "index.json")
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(index_path + ".tmp", 'w', encoding='utf-8') as file:
+                json.dump(snapshot, file)
+            os.replace(index_path + ".tmp", index_path)  # Replace atomically so a crash never leaves a torn index
+        except OSError as e:
+            with response_cache_lock:
+                response_cache_dirty = True  # Try again on the next flush
+            print(f"Failed to save the response cache index: {e}")
+
+
+def evict_response_cache():
+    """Drop least recently used entries until the cache fits its byte budget. The caller must hold the lock."""
+    global response_cache_bytes, response_cache_dirty
+    while response_cache and response_cache_bytes > cache_max_bytes:
+        key, entry = response_cache.popitem(last=False)  # The first entry is the least recently used
+        response_cache_bytes -= entry['size']
+        response_cache_dirty = True
+        try:
+            os.remove(os.path.join(cache_dir, key))
+        except OSError:
+            pass
+
+
+def store_response(key, url, response, ttl=None):
+    """Store a fetched response in the cache, honouring its caching headers unless a TTL override is given."""
+    global response_cache_bytes, response_cache_dirty
+    lifetime = response_lifetime(response)
+    if lifetime is None:  # The response must not be cached
+        return
+    if ttl is not None:  # Per-job TTL overrides what the server suggests
+        lifetime = ttl
+
+    body = response.content
+    now = time.time()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(os.path.join(cache_dir, key + ".tmp"), 'wb') as file:
+            file.write(body)
+        os.replace(os.path.join(cache_dir, key + ".tmp"), os.path.join(cache_dir, key))
+    except OSError as e:
+        print(f"Failed to cache {url}: {e}")
+        return
+
+    with response_cache_lock:
+        old_entry = response_cache.pop(key, None)
+        if old_entry:
+            response_cache_bytes -= old_entry['size']
+        response_cache_dirty = True
+        response_cache[key] = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'stored': now,
+            'expires': now + lifetime,
+            'size': len(body),
+            'last_used': now,
+        }
+        response_cache_bytes += len(body)
+        evict_response_cache()
+    save_response_cache_index()  # Written only once the flush interval has passed
+
+
+def read_cached_body(key):
+    """Return the cached body for a key and mark it as most recently used, or None if it is not available."""
+    try:
+        with open(os.path.join(cache_dir, key), 'rb') as file:
+            body = file.read()
+    except OSError:
+        return None
+
+    global response_cache_dirty
+    with response_cache_lock:
+        if key in response_cache:
+            response_cache.move_to_end(key)  # Mark as most recently used
+            response_cache[key]['last_used'] = time.time()
+            response_cache_dirty = True  # Keep the LRU order across restarts
+    return body
+
+
+def fetch_page(url, headers=None, ttl=None, timeout=None, retries=None, rate_limit=None):
+    """Return the body of the page at the given URL, serving it from the shared response cache while it is fresh.
+
+    A ttl (in seconds) overrides the lifetime the server advertises through Cache-Control/Expires; timeout, retries
+    and rate_limit (requests per second to the host) override the network policy for this fetch.
+    """
+    headers = headers or {}
+    key = cache_key(url, headers)
+
+    with response_cache_lock:
+        entry = dict(response_cache[key]) if key in response_cache else None
+
+    if entry:
+        expires = entry['stored'] + ttl if ttl is not None else entry['expires']
+        if time.time() < expires:  # Fresh cache hit: no network access needed
+            body = read_cached_body(key)
+            if body is not None:
+                return body
+
+    # Concurrent identical fetches share one request: the first caller does the work, the others wait for its
+    # result. No lock is held while the request (with its retries and backoff) is in flight.
+    with response_cache_lock:
+        inflight = response_cache_inflight.get(key)
+        if inflight is None:
+            inflight = response_cache_inflight[key] = Future()
+            owner = True
+        else:
+            owner = False
+    if not owner:
+        return inflight.result()
+
+    try:
+        body = fetch_and_store(url, key, entry, headers, ttl, timeout, retries, rate_limit)
+        inflight.set_result(body)
+        return body
+    except BaseException as e:
+        inflight.set_exception(e)
+        raise
+    finally:
+        with response_cache_lock:
+            response_cache_inflight.pop(key, None)
+
+
+def fetch_and_store(url, key, entry, headers, ttl, timeout, retries, rate_limit):
+    """Fetch a page from the network, revalidating a stale cache entry if there is one, and cache the result."""
+    global response_cache_dirty
+    # Revalidate a stale entry with a conditional request instead of downloading it again
+    request_headers = dict(headers)
+    if entry and entry.get('etag'):
+        request_headers['If-None-Match'] = entry['etag']
+    if entry and entry.get('last_modified'):
+        request_headers['If-Modified-Since'] = entry['last_modified']
+
+    response = fetch_with_retry(url, request_headers, timeout, retries, rate_limit)  # Make an HTTP GET request
+    if response.status_code == 304 and entry:  # Not modified: refresh the entry and serve the cached body
+        body = read_cached_body(key)
+        if body is not None:
+            lifetime = response_lifetime(response)
+            with response_cache_lock:
+                if key in response_cache:
+                    response_cache[key]['stored'] = time.time()
+                    response_cache[key]['expires'] = time.time() + (lifetime or 0)
+                    response_cache_dirty = True
+            save_response_cache_index()  # Written only once the flush interval has passed
+            return body
+        response = fetch_with_retry(url, headers, timeout, retries, rate_limit)  # The cached body vanished
+
+    response.raise_for_status()  # Raise an exception if the request was unsuccessful
+    store_response(key, url, response, ttl)
+    return response.content
+
+
+def report_scrape_error(job, message):
+    """Record a scrape failure in the job's state, or show it in a dialog for manual scrapes."""
+    if job is None:  # Manual scrape: the user is at the screen
+        messagebox.showerror("Error", message)
+        return
+
+    # Scheduled job: nobody is there to dismiss a dialog, so keep the failure with the job instead
+    scan = scans.setdefault(job, {"state": "Stopped"})
+    scan['last_error'] = message
+    scan['last_error_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    scan['consecutive_failures'] = scan.get('consecutive_failures', 0) + 1
+    print(f"{job}: {message}")
+
+
+def fetch_job_page(url, scan):
+    """Fetch a page with a job's cache and network settings."""
+    # Reuse a fresh cached copy when there is one; jobs may override cache and network policy
+    return fetch_page(url, ttl=scan.get('cache_ttl'), timeout=scan.get('timeout'), retries=scan.get('retries'),
+                      rate_limit=scan.get('rate_limit'))
+
+
+def select_elements(soup, tag, scan):
+    """Find the elements a job extracts: those matching its CSS selector if it has one, else those with the tag."""
+    if scan.get('selector'):
+        return soup.select(scan['selector'])
+    return soup.find_all(tag)
+
+
+def scrape_content(url, tag, scan):
+    """Fetch a page and return every element with the given tag as HTML, separated by blank lines."""
+    content = fetch_job_page(url, scan)
+    soup = BeautifulSoup(content, 'html.parser')  # Parse the HTML content using BeautifulSoup
+    elements = select_elements(soup, tag, scan)  # Find all elements with the specified tag or selector
+    return "".join(str(element) + "\n\n" for element in elements)
+
+
+def scrape_job(job):
+    """Run a scheduled scrape job without touching the GUI, saving its results into the job's folder.
+
+    Jobs run on worker threads, so everything here works on the job's own content rather than the globals and
+    widgets of the main window.
+    """
+    scan = scans.get(job, {})
+    url = scan.get('url')
+    if not url or not (scan.get('tag') or scan.get('selector')):
+        report_scrape_error(job, "Please enter both a URL and a tag.")
+        return
+
+    try:
+        content = scrape_content(url, scan.get('tag'), scan)  # Fetch the page and extract the job's elements
+        auto_save(job, content)  # Automatically save the scraped content after scraping
+        if scan.get('table_format'):  # Append the tables in the content to the job's table files
+            save_tables(job, content, scan['table_format'])
+        save_job_assets(job, url, content)
+
+        # Record the successful run in the job's state
+        scan['last_success_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        scan['consecutive_failures'] = 0
+    except requests.exceptions.RequestException as e:  # Handle any HTTP-related exceptions
+        report_scrape_error(job, f"Failed to retrieve the page: {e}")
+
+
 def scrape():
     """Scrape the HTML content from the given URL based on the specified tag and display it in the text area."""
     global full_content, previous_content  # Use global variables to track content
@@ -75,20 +555,15 @@ def scrape():
         return
 
     try:
-        response = requests.get(url)  # Make an HTTP GET request to the specified URL
-        response.raise_for_status()  # Raise an exception if the request was unsuccessful
-        soup = BeautifulSoup(response.content, 'html.parser')  # Parse the HTML content using BeautifulSoup
-        elements = soup.find_all(tag)  # Find all elements with the specified tag
+        content = scrape_content(url, tag, {})  # Fetch the page and extract the elements with the tag
 
         # Clear the text areas before displaying new content
         text_area.delete(1.0, tk.END)
         preview_text_area.delete(1.0, tk.END)
         previous_content = full_content  # Store previous content before updating
-        full_content = ""  # Clear full_content for new data
+        full_content = content  # Store the full elements with tags
 
-        if elements:  # If elements are found with the specified tag
-            for element in elements:
-                full_content += str(element) + "\n\n"  # Store full element with tags
+        if full_content:  # If elements are found with the specified tag
             # Display only the first 10000 characters in the preview text area
             preview_text_area.insert(tk.END, full_content[:10000] + "\n\n... [Content Truncated]")
         else:  # If no elements are found
@@ -96,40 +571,71 @@ def scrape():
 
         update_last_updated(last_updated_label)  # Update the last updated label with the current time
 
-        auto_save()  # Automatically save the scraped content after scraping
+        auto_save(content=content)  # Automatically save the scraped content after scraping
 
     except requests.exceptions.RequestException as e:  # Handle any HTTP-related exceptions
         messagebox.showerror("Error", f"Failed to retrieve the page: {e}")
 
 
-def auto_save():
-    """Automatically save the scraped content to a file based on the user's preferences."""
-    global full_content, job_name
+def job_output_settings(job):
+    """Return the file extension for a job's snapshots and whether tags are stripped from them.
 
-    file_content = full_content.strip()  # Remove any leading or trailing whitespace
-    if not file_content:  # If there is no content, do not save
+    Jobs can set output_format and strip_tags themselves; otherwise the options selected in the main window apply.
+    """
+    scan = scans.get(job, {})
+    output_format = scan.get('output_format')
+    if output_format is None:
+        output_format = {1: "csv", 2: "json"}.get(file_format_option.get(), "txt") if file_format_option else "txt"
+    strip_tags = scan.get('strip_tags')
+    if strip_tags is None:
+        strip_tags = save_option.get() == 2 if save_option else False
+    return f".{output_format}", strip_tags
+
+
+def prune_snapshots(job, label, file_ext):
+    """Delete the oldest snapshots of a job beyond its max_files retention limit.
+
+    Snapshots are counted per label, so each page of a crawl keeps its own history.
+    """
+    keep = scans.get(job, {}).get('max_files')
+    if not keep:
         return
+    # The timestamp is matched character by character so that labelled snapshots are not counted as unlabelled ones
+    pattern = os.path.join(glob.escape(job_dir(job)), "active_scans",
+                           f"{glob.escape(job)}_{glob.escape(label)}????????_??????{file_ext}")
+    for old_file in sorted(glob.glob(pattern))[:-keep]:  # Timestamps sort chronologically
+        try:
+            os.remove(old_file)
+        except OSError as e:
+            print(f"Failed to remove old snapshot {old_file}: {e}")
 
-    # Determine the file extension based on the selected file format
-    if file_format_option.get() == 1:
-        file_ext = ".csv"
-    elif file_format_option.get() == 2:
-        file_ext = ".json"
-    else:
-        file_ext = ".txt"
 
-    # Check if tags should be removed before saving
-    if save_option.get() == 2:  # Without Tags option
+def auto_save(job=None, content=None, label=None):
+    """Automatically save the scraped content to a file based on the user's preferences.
+
+    Returns the path of the saved file, or None if nothing was saved.
+    """
+    global full_content, job_name
+    job = job or job_name  # Save into the folder of the job that scraped, or of the last scheduled job
+
+    file_content = (full_content if content is None else content).strip()  # Remove leading/trailing whitespace
+    if not file_content:  # If there is no content, do not save
+        return None
+
+    # Determine the file extension and whether tags should be removed before saving
+    file_ext, strip_tags = job_output_settings(job)
+    if strip_tags:  # Without Tags option
         soup = BeautifulSoup(file_content, 'html.parser')
         file_content = soup.get_text()  # Extract and save only the text
 
     # Generate a file path based on the job name and timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    if not job_name:
+    if not job:
         print("Failed to save the file: Job name not provided.")
-        return
+        return None
 
-    file_path = f"./{job_name}/active_scans/{job_name}_{timestamp}{file_ext}"
+    label = f"{label}_" if label else ""  # Optional label, e.g. to tell apart the pages of a crawl
+    file_path = os.path.join(job_dir(job), "active_scans", f"{job}_{label}{timestamp}{file_ext}")
 
     try:
         # Save the content to a file
@@ -137,8 +643,140 @@ def auto_save():
         with open(file_path, 'w', encoding='utf-8') as file:
             file.write(file_content)
         print(f"Content automatically saved to {file_path}")
+        prune_snapshots(job, label, file_ext)
+        return file_path
     except Exception as e:  # Handle any exceptions that occur during the save process
         print(f"Failed to save the file: {e}")
+        return None
+
+
+def open_crawl_db(job):
+    """Open the crawl database of a job, which holds its URL frontier and the set of URLs already seen.
+
+    Keeping both on disk bounds memory for very large sites and lets an interrupted crawl resume where it stopped.
+    """
+    os.makedirs(job_dir(job), exist_ok=True)
+    conn = sqlite3.connect(os.path.join(job_dir(job), "crawl.db"))
+    # Every discovered URL gets one row, so the primary key doubles as the seen-URL set
+    conn.execute("""CREATE TABLE IF NOT EXISTS frontier (
+                        url TEXT PRIMARY KEY,
+                        depth INTEGER NOT NULL,
+                        priority INTEGER NOT NULL,
+                        status TEXT NOT NULL DEFAULT 'pending',
+                        snapshot TEXT,
+                        error TEXT)""")
+    conn.execute("CREATE INDEX IF NOT EXISTS frontier_pending ON frontier (status, priority)")
+    conn.execute("CREATE TABLE IF NOT EXISTS crawl_state (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    return conn
+
+
+def normalize_link(base_url, href):
+    """Resolve a link against the page it was found on, dropping fragments; returns None for non-HTTP links."""
+    url, _ = urldefrag(urljoin(base_url, href.strip()))
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return None
+    return parsed._replace(scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower()).geturl()
+
+
+def crawl_link_allowed(scan, url, depth):
+    """Check a discovered link against the crawl job's depth, domain and pattern filters."""
+    if depth > scan.get('max_depth', 2):
+        return False
+
+    host = urlparse(url).hostname or ""
+    domains = scan.get('allowed_domains') or [urlparse(scan['url']).hostname]  # Default to the seed's domain
+    if not any(host == domain or host.endswith("." + domain) for domain in domains):
+        return False
+
+    pattern = scan.get('url_pattern')
+    return not pattern or re.search(pattern, url) is not None
+
+
+def crawl(job):
+    """Crawl a job's site: take URLs from its frontier, extract the job's tag from each page and enqueue the links.
+
+    Each run processes at most the job's max_pages_per_run pages; the next scheduled run resumes from the frontier,
+    and once every known page has been visited it starts a new pass over them.
+    """
+    scan = scans[job]
+    tag = scan.get('tag')
+    if not scan.get('url') or not (tag or scan.get('selector')):
+        report_scrape_error(job, "Please enter both a URL and a tag.")
+        return
+
+    seed = normalize_link(scan['url'], scan['url'])
+    if seed is None:  # Only http(s) pages can be crawled
+        report_scrape_error(job, f"Cannot crawl {scan['url']!r}: the start URL must be an http or https URL.")
+        return
+
+    conn = open_crawl_db(job)
+    try:
+        # Seed the frontier with the start URL the first time the job runs
+        conn.execute("INSERT OR IGNORE INTO frontier (url, depth, priority) VALUES (?, 0, 0)", (seed,))
+        conn.execute("INSERT OR IGNORE INTO crawl_state (name, value) VALUES ('pass', 1)")
+
+        # Once every known page has been visited, start a new pass so the job keeps refreshing its pages
+        if not conn.execute("SELECT 1 FROM frontier WHERE status = 'pending' LIMIT 1").fetchone():
+            conn.execute("UPDATE frontier SET status = 'pending', error = NULL WHERE status IN ('done', 'failed')")
+            conn.execute("UPDATE crawl_state SET value = value + 1 WHERE name = 'pass'")
+        conn.commit()
+
+        pages = 0
+        stopped_by_error = False  # Set when the run ends early because the host is unreachable
+        while pages < scan.get('max_pages_per_run', 100):
+            if pause_flag or scan.get('state') == 'Paused':  # Stop early; the frontier keeps our progress
+                break
+
+            # Take the next URL, shallowest pages first
+            row = conn.execute("SELECT url, depth FROM frontier WHERE status = 'pending' "
+                               "ORDER BY priority, rowid LIMIT 1").fetchone()
+            if row is None:  # Nothing left to crawl
+                break
+            url, depth = row
+
+            try:
+                content = fetch_job_page(url, scan)
+            except CircuitOpenError as e:  # The host is down; leave the URL pending for a later run
+                report_scrape_error(job, f"Crawl paused: {e}")
+                stopped_by_error = True
+                break
+            except requests.exceptions.RequestException as e:
+                conn.execute("UPDATE frontier SET status = 'failed', error = ? WHERE url = ?", (str(e), url))
+                conn.commit()
+                pages += 1
+                continue
+
+            soup = BeautifulSoup(content, 'html.parser')  # Parse the HTML content using BeautifulSoup
+            elements = select_elements(soup, tag, scan)  # Extract the job's tag or selector from the page
+            page_content = "".join(str(element) + "\n\n" for element in elements)
+            label = hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]  # Tells apart the files of each page
+            snapshot = auto_save(job, page_content, label)
+            if scan.get('table_format'):  # Append the page's tables to its own table files
+                save_tables(job, page_content, scan['table_format'], label)
+            save_job_assets(job, url, page_content)
+
+            # Enqueue the page's links; INSERT OR IGNORE drops every URL that has been seen before
+            if depth < scan.get('max_depth', 2):
+                links = (normalize_link(url, a['href']) for a in soup.find_all('a', href=True))
+                conn.executemany("INSERT OR IGNORE INTO frontier (url, depth, priority) VALUES (?, ?, ?)",
+                                 [(link, depth + 1, depth + 1) for link in links
+                                  if link and crawl_link_allowed(scan, link, depth + 1)])
+
+            conn.execute("UPDATE frontier SET status = 'done', snapshot = ? WHERE url = ?", (snapshot, url))
+            conn.commit()
+            pages += 1
+
+        # Keep the crawl's progress with the job so it can be shown in the Scheduled Scans window
+        counts = dict(conn.execute("SELECT status, COUNT(*) FROM frontier GROUP BY status").fetchall())
+        crawl_pass = conn.execute("SELECT value FROM crawl_state WHERE name = 'pass'").fetchone()[0]
+        scan['crawl_progress'] = (f"Pass {crawl_pass}: {counts.get('done', 0)} pages crawled, "
+                                  f"{counts.get('pending', 0)} pending, {counts.get('failed', 0)} failed")
+        if not stopped_by_error:  # The failure has already been recorded by report_scrape_error
+            scan['last_success_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            scan['consecutive_failures'] = 0
+    finally:
+        conn.close()
 
 
 def save_to_file():
@@ -336,10 +974,337 @@ def parse_data(parse_type):
         images = [img['src'] for img in soup.find_all('img', src=True)]
         for img in images:
             text_area.insert(tk.END, img + "\n")
-    elif parse_type == "tables":  # If parsing tables, extract and display all tables as HTML
+    elif parse_type == "tables":  # If parsing tables, extract and display all tables as rows of cells
         tables = soup.find_all('table')
         for table in tables:
-            text_area.insert(tk.END, str(table) + "\n\n")
+            header, rows = table_to_rows(table)
+            types = [infer_column_type([row[column] for row in rows]) for column in range(len(header))]
+            text_area.insert(tk.END, " | ".join(f"{name} ({column_type})" for name, column_type in zip(header, types)))
+            for row in rows:
+                text_area.insert(tk.END, "\n" + " | ".join(row))
+            text_area.insert(tk.END, "\n\n")
+
+
+def table_to_rows(table):
+    """Flatten an HTML table into a header and rows of cell text, expanding rowspan and colspan.
+
+    The header is the first row when it is made of <th> cells; otherwise columns are named column_1, column_2, ...
+    """
+    grid = []  # Rows of cell text, filled in as spans are expanded
+    pending = {}  # Column index -> [text, rows left] for cells spanning down from earlier rows
+    header_row = False
+
+    # Only look at this table's own rows, not those of tables nested inside it
+    rows = [row for row in table.find_all('tr') if row.find_parent('table') is table]
+    for row_index, row in enumerate(rows):
+        cells = row.find_all(['td', 'th'], recursive=False)
+        if row_index == 0:
+            header_row = bool(cells) and all(cell.name == 'th' for cell in cells)
+
+        values = []
+        column = 0
+        for cell in cells:
+            while column in pending:  # Skip columns still covered by a rowspan from above
+                values.append(pending[column][0])
+                column += 1
+            text = cell.get_text(" ", strip=True)
+            colspan = int(cell.get('colspan', 1)) if str(cell.get('colspan', 1)).isdigit() else 1
+            rowspan = int(cell.get('rowspan', 1)) if str(cell.get('rowspan', 1)).isdigit() else 1
+            for _ in range(max(colspan, 1)):
+                if rowspan > 1:
+                    pending[column] = [text, rowspan]
+                values.append(text)
+                column += 1
+        while column in pending:  # Trailing columns covered by a rowspan
+            values.append(pending[column][0])
+            column += 1
+
+        # Count down the rowspans that covered this row
+        for spanned_column in list(pending):
+            pending[spanned_column][1] -= 1
+            if pending[spanned_column][1] <= 0:
+                del pending[spanned_column]
+        grid.append(values)
+
+    width = max((len(values) for values in grid), default=0)
+    grid = [values + [""] * (width - len(values)) for values in grid]  # Pad ragged rows
+    if header_row and grid:
+        header = []
+        for index, name in enumerate(grid.pop(0)):
+            if not name or name in header or name == 'scan_timestamp':  # Column names must be unique
+                name = f"{name or 'column'}_{index + 1}"
+            header.append(name)
+    else:
+        header = [f"column_{index + 1}" for index in range(width)]
+    return header, grid
+
+
+def infer_column_type(values):
+    """Infer whether a column holds integers, floats, booleans or strings, ignoring empty cells."""
+    values = [value.replace(",", "").strip() for value in values if value.strip()]
+    if not values:
+        return "string"
+    if all(re.fullmatch(r"[-+]?\d+", value) for value in values):
+        return "int"
+    if all(re.fullmatch(r"[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?", value) for value in values):
+        return "float"
+    if all(value.lower() in ("true", "false", "yes", "no") for value in values):
+        return "bool"
+    return "string"
+
+
+def widen_column_type(column_type, values):
+    """Return the narrowest type at least as wide as column_type that holds all the values (int -> float -> string)."""
+    inferred = infer_column_type(values)
+    if column_type == "string" or inferred == column_type or not any(value.strip() for value in values):
+        return column_type
+    if {column_type, inferred} == {"int", "float"}:  # Integers fit a float column, and decimals widen an int one
+        return "float"
+    return "string"  # Anything else, e.g. "n/a" in a numeric column, is kept as text
+
+
+def convert_cell(value, column_type):
+    """Convert a cell's text to the column type; empty cells become None."""
+    if not value.strip():
+        return None
+    if column_type == "int":
+        return int(value.replace(",", ""))
+    if column_type == "float":
+        return float(value.replace(",", ""))
+    if column_type == "bool":
+        return value.strip().lower() in ("true", "yes")
+    return value
+
+
+def table_schema(job, index, header, rows, label=None):
+    """Return the file base path and column types under which a scanned table is stored.
+
+    The columns and types of each table are saved in ./<job>/tables/table_<n>.schema.json the first time they are
+    seen, and later scans with the same columns are cast to them, so every snapshot of a table shares one schema.
+    If the columns change, or a later scan has values that do not fit the stored types (e.g. "1.5" or "n/a" in an
+    int column), the table gets a new version (table_<n>_v2, ...) with its own schema and files; types are only
+    ever widened (int -> float -> string), so no cell is dropped. A label (e.g. of a crawled page) keeps tables from
+    different pages apart: <label>_table_<n>.
+    """
+    tables_dir = os.path.join(job_dir(job), "tables")
+    table_name = f"{label}_table_{index}" if label else f"table_{index}"
+    schema_path = os.path.join(tables_dir, f"{table_name}.schema.json")
+    try:
+        with open(schema_path, 'r', encoding='utf-8') as file:
+            versions = json.load(file)
+    except (OSError, ValueError):  # First scan of this table
+        versions = []
+
+    columns = [[row[column] for row in rows] for column in range(len(header))]
+    known = [version for version in versions if version['columns'] == header]
+    for version in known:
+        if all(widen_column_type(column_type, values) == column_type
+               for column_type, values in zip(version['types'], columns)):
+            break  # Known columns and the values fit: keep the stored types
+    else:
+        if known:  # Same columns, but some values need a wider type than the latest version has
+            types = [widen_column_type(column_type, values)
+                     for column_type, values in zip(known[-1]['types'], columns)]
+        else:
+            types = [infer_column_type(values) for values in columns]
+        versions.append({'columns': header, 'types': types})
+        version = versions[-1]
+        os.makedirs(tables_dir, exist_ok=True)
+        with open(schema_path + ".tmp", 'w', encoding='utf-8') as file:
+            json.dump(versions, file, indent=1)
+        os.replace(schema_path + ".tmp", schema_path)
+
+    number = versions.index(version) + 1
+    suffix = "" if number == 1 else f"_v{number}"
+    return os.path.join(tables_dir, f"{table_name}{suffix}"), version['types']
+
+
+def save_tables(job, content, table_format="csv", label=None):
+    """Extract the tables in the scraped content and append them to per-table columnar files of the job.
+
+    Each table gets a scan_timestamp column and is cast to the table's stored schema (see table_schema). CSV rows are
+    appended to ./<job>/tables/table_<n>.csv; Parquet output adds one file per scan under ./<job>/tables/table_<n>/,
+    which together form a dataset that can be queried directly.
+    """
+    if table_format == "parquet" and pa is None:
+        print("pyarrow is not installed; saving tables as CSV instead.")
+        table_format = "csv"
+
+    scan_time = datetime.now()
+    soup = BeautifulSoup(content, 'html.parser')
+    for index, table in enumerate(soup.find_all('table'), start=1):
+        header, rows = table_to_rows(table)
+        if not rows:
+            continue
+        try:
+            base_path, types = table_schema(job, index, header, rows, label)
+            columns = {name: [convert_cell(row[column], types[column]) for row in rows]
+                       for column, name in enumerate(header)}
+
+            if table_format == "parquet":
+                os.makedirs(base_path, exist_ok=True)
+                arrow_types = {"int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(), "string": pa.string()}
+                data = {'scan_timestamp': pa.array([scan_time] * len(rows), type=pa.timestamp('s'))}
+                data.update({name: pa.array(values, type=arrow_types[column_type])
+                             for (name, values), column_type in zip(columns.items(), types)})
+                pq.write_table(pa.table(data), os.path.join(base_path, f"scan_{scan_time:%Y%m%d_%H%M%S}.parquet"))
+            else:
+                file_path = f"{base_path}.csv"
+                new_file = not os.path.exists(file_path)
+                with open(file_path, 'a', newline='', encoding='utf-8') as file:
+                    writer = csv.writer(file)
+                    if new_file:
+                        writer.writerow(['scan_timestamp'] + header)
+                    for row_values in zip(*columns.values()):
+                        writer.writerow([scan_time.isoformat(timespec='seconds')] +
+                                        ["" if value is None else value for value in row_values])
+        except (OSError, ValueError) as e:
+            print(f"Failed to save table {index} of {job}: {e}")
+
+
+def load_asset_manifest(job):
+    """Load the asset manifest of a job, which maps each asset URL to its stored file and cache validators."""
+    try:
+        with open(os.path.join(job_dir(job), "assets", "manifest.json"), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):  # No assets downloaded yet, or the manifest is unreadable
+        return {}
+
+
+def save_asset_manifest(job, manifest):
+    """Write the asset manifest of a job to disk."""
+    manifest_path = os.path.join(job_dir(job), "assets", "manifest.json")
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    with open(manifest_path + ".tmp", 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=1)
+    os.replace(manifest_path + ".tmp", manifest_path)  # Replace atomically so a crash never leaves a torn manifest
+
+
+def download_asset(job, url, entry):
+    """Download one asset into the job's content-addressed asset store, streaming it to disk in chunks.
+
+    A known asset is revalidated with a conditional request and only downloaded again if it changed. Returns the
+    manifest entry for the URL together with "downloaded" or "unchanged".
+    """
+    host = urlparse(url).netloc
+    check_circuit(host)  # Skip hosts that are known to be down
+    wait_for_rate_limit(host, scans.get(job, {}).get('rate_limit') or host_policy(url).get('rate_limit'))
+
+    headers = {}
+    if entry and os.path.exists(entry['path']):  # Ask the server whether our copy is still current
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    try:
+        with asset_session.get(url, headers=headers, timeout=request_timeout, stream=True) as response:
+            if response.status_code == 304:  # Unchanged since the last scan
+                record_host_result(host, True)
+                return entry, "unchanged"
+            response.raise_for_status()
+
+            # Stream the body to a temporary file, hashing it on the way so it never sits in memory in full
+            asset_dir = os.path.join(job_dir(job), "assets")
+            os.makedirs(asset_dir, exist_ok=True)
+            digest = hashlib.sha256()
+            temp_path = os.path.join(asset_dir, f".{hashlib.sha1(url.encode('utf-8')).hexdigest()}.part")
+            try:
+                with open(temp_path, 'wb') as file:
+                    for chunk in response.iter_content(chunk_size=asset_chunk_size):
+                        digest.update(chunk)
+                        file.write(chunk)
+            except (OSError, requests.exceptions.RequestException):
+                if os.path.exists(temp_path):  # Do not leave partial files behind
+                    os.remove(temp_path)
+                raise
+            headers = response.headers
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+        record_host_result(host, False)
+        raise
+    record_host_result(host, True)
+
+    # Store the file under its content hash so identical assets from different URLs are kept once
+    sha256 = digest.hexdigest()
+    extension = os.path.splitext(urlparse(url).path)[1][:10]
+    file_path = os.path.join(asset_dir, sha256[:2], sha256 + extension)
+    if os.path.exists(file_path):
+        os.remove(temp_path)
+    else:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.replace(temp_path, file_path)
+
+    new_entry = {'path': file_path, 'sha256': sha256, 'etag': headers.get('ETag'),
+                 'last_modified': headers.get('Last-Modified')}
+    return new_entry, "unchanged" if entry and entry.get('sha256') == sha256 else "downloaded"
+
+
+def download_assets(job, page_url, sources):
+    """Resolve asset URLs found on a page and download them concurrently into the job's asset store.
+
+    Returns a dictionary counting the downloaded, unchanged and failed assets.
+    """
+    # Resolve relative URLs against the page and drop duplicates, keeping the order they appear in
+    urls = [url for url in dict.fromkeys(normalize_link(page_url, source) for source in sources) if url]
+    manifest = load_asset_manifest(job)
+    counts = {"downloaded": 0, "unchanged": 0, "failed": 0}
+    updates = {}  # Manifest entries of the assets handled in this batch
+
+    with ThreadPoolExecutor(max_workers=asset_workers) as executor:
+        futures = {executor.submit(download_asset, job, url, manifest.get(url)): url for url in urls}
+        for future, url in futures.items():
+            try:
+                updates[url], status = future.result()
+                counts[status] += 1
+            except (OSError, requests.exceptions.RequestException) as e:
+                counts["failed"] += 1
+                print(f"Failed to download {url}: {e}")
+
+    # Merge into the manifest as it is on disk now, so entries saved by a concurrent download are not lost
+    with asset_manifest_locks_lock:
+        manifest_lock = asset_manifest_locks.setdefault(job, threading.Lock())
+    with manifest_lock:
+        manifest = load_asset_manifest(job)
+        manifest.update(updates)
+        save_asset_manifest(job, manifest)
+    return counts
+
+
+def save_job_assets(job, page_url, content):
+    """Download the images referenced by a job's scraped content if the job asks for it."""
+    if not scans.get(job, {}).get('download_images'):
+        return
+    soup = BeautifulSoup(content, 'html.parser')
+    counts = download_assets(job, page_url, [img['src'] for img in soup.find_all('img', src=True)])
+    print(f"{job}: {counts['downloaded']} images downloaded, {counts['unchanged']} unchanged, "
+          f"{counts['failed']} failed")
+
+
+def download_images():
+    """Download the images in the scraped content into the current job's folder without blocking the UI."""
+    file_content = full_content.strip()
+    if not file_content:  # If there is no content, display an error message
+        messagebox.showerror("Error", "No content to download images from.")
+        return
+
+    page_url = url_entry.get()
+    soup = BeautifulSoup(file_content, 'html.parser')
+    sources = [img['src'] for img in soup.find_all('img', src=True)]
+    job = manual_downloads_job  # Keep manual downloads apart from the asset stores of scheduled jobs
+
+    def run_download():
+        # Tk is not thread-safe, so the outcome is shown from the main loop
+        try:
+            counts = download_assets(job, page_url, sources)
+        except Exception as e:  # Report the failure instead of letting the thread die silently
+            error = f"Failed to download images: {e}"
+            root.after(0, lambda: messagebox.showerror("Error", error))
+            return
+        root.after(0, lambda: messagebox.showinfo(
+            "Images Downloaded", f"{counts['downloaded']} downloaded, {counts['unchanged']} unchanged, "
+                                 f"{counts['failed']} failed.\nSaved to {os.path.join(job_dir(job), 'assets')}"))
+
+    threading.Thread(target=run_download, daemon=True).start()
 
 
 def highlight_differences():
@@ -392,6 +1357,8 @@ def update_active_scans_listbox():
         active_scans_listbox.delete(0, tk.END)  # Clear the listbox
         for job_name, scan_info in scans.items():  # Add each scan and its current state to the listbox
             scan_state = scan_info.get('state', 'Unknown')  # Retrieve the current state of the scan
+            if scan_info.get('consecutive_failures'):  # Flag jobs whose recent runs failed
+                scan_state += f" ({scan_info['consecutive_failures']} failed runs)"
             active_scans_listbox.insert(tk.END, f"{job_name} - {scan_state}")  # Display the job name and its state
     else:
         print("Warning: active_scans_listbox is not initialized or has been destroyed.")
@@ -467,8 +1434,10 @@ def open_schedule_window():
             update_control_buttons(selected_scan)  # Update control buttons for the selected scan
 
             try:
-                # Define the pattern to match files with the selected_scan and any timestamp
-                file_pattern = f"./{selected_scan}/active_scans/{selected_scan}_*.txt"
+                # Define the pattern to match files with the selected_scan, any timestamp and the job's extension
+                extension = job_output_settings(selected_scan)[0]
+                file_pattern = os.path.join(glob.escape(job_dir(selected_scan)), "active_scans",
+                                            f"{glob.escape(selected_scan)}_*{extension}")
 
                 # Use glob to find all files that match the pattern
                 matching_files = glob.glob(file_pattern)
@@ -478,7 +1447,7 @@ def open_schedule_window():
                     latest_file = max(matching_files, key=os.path.getmtime)
 
                     # Open the most recent matching file
-                    with open(latest_file, 'r') as file:
+                    with open(latest_file, 'r', encoding='utf-8') as file:
                         job_results = file.read()
 
                     # Limit the output to 2000 characters
@@ -498,6 +1467,15 @@ def open_schedule_window():
                 job_results_text_area.delete(1.0, tk.END)
                 job_results_text_area.insert(tk.END, f"Error loading job results: {str(e)}")
 
+            # Show the progress of crawl jobs and the most recent failure of the job above its results
+            crawl_progress = scans.get(selected_scan, {}).get('crawl_progress')
+            if crawl_progress:
+                job_results_text_area.insert(1.0, f"{crawl_progress}\n\n")
+            last_error = scans.get(selected_scan, {}).get('last_error')
+            if last_error:
+                job_results_text_area.insert(1.0, f"Last error ({scans[selected_scan]['last_error_at']}): "
+                                                  f"{last_error}\n\n")
+
     def run_scan(scan_name):
         """Set the state of the selected scan to 'Running', start the scan, and update the UI."""
         if scan_name in scans and scans[scan_name]['state'] != 'Running':
@@ -543,10 +1521,14 @@ def open_schedule_window():
         """Update the active scans listbox with the current scan information."""
         active_scans_listbox.delete(0, tk.END)  # Clear the listbox
         for job_name, scan_info in scans.items():  # Add each scan and its state to the listbox
-            active_scans_listbox.insert(tk.END, f"{job_name} - {scan_info['state']}")
-
-    # Example usage: Adding two sample scans
-    scans[job_name] = {"state": "Stopped"}
+            scan_state = scan_info['state']
+            if scan_info.get('consecutive_failures'):  # Flag jobs whose recent runs failed
+                scan_state += f" ({scan_info['consecutive_failures']} failed runs)"
+            active_scans_listbox.insert(tk.END, f"{job_name} - {scan_state}")
+
+    # Add the most recently scheduled job if it is not tracked yet, keeping the settings of known jobs
+    if job_name and job_name not in scans:
+        scans[job_name] = {"state": "Stopped"}
     update_active_scans_listbox()  # Update the active scans listbox
 
     # Bind the selection event to update job results when a scan is selected
@@ -584,10 +1566,71 @@ def open_schedule_popup():
     max_files_entry = ttk.Entry(schedule_popup, width=10)  # Entry widget for the max files
     max_files_entry.grid(row=2, column=1, padx=10, pady=10)
 
+    # Create and place the cache TTL label and entry field (leave empty to follow the server's caching headers)
+    cache_ttl_label = ttk.Label(schedule_popup, text="Cache TTL (seconds):")
+    cache_ttl_label.grid(row=3, column=0, padx=10, pady=10)
+
+    cache_ttl_entry = ttk.Entry(schedule_popup, width=10)  # Entry widget for the per-job cache lifetime
+    cache_ttl_entry.grid(row=3, column=1, padx=10, pady=10)
+
+    # Create and place the timeout and retries labels and entry fields (leave empty to use the defaults)
+    timeout_label = ttk.Label(schedule_popup, text="Timeout (seconds):")
+    timeout_label.grid(row=4, column=0, padx=10, pady=10)
+
+    timeout_entry = ttk.Entry(schedule_popup, width=10)  # Entry widget for the per-job request timeout
+    timeout_entry.grid(row=4, column=1, padx=10, pady=10)
+
+    retries_label = ttk.Label(schedule_popup, text="Retries:")
+    retries_label.grid(row=5, column=0, padx=10, pady=10)
+
+    retries_entry = ttk.Entry(schedule_popup, width=10)  # Entry widget for the per-job retry count
+    retries_entry.grid(row=5, column=1, padx=10, pady=10)
+
+    # Create and place the job type combobox: scrape the page only, or crawl the links found on it
+    job_type_label = ttk.Label(schedule_popup, text="Job Type:")
+    job_type_label.grid(row=6, column=0, padx=10, pady=10)
+
+    job_type_combobox = ttk.Combobox(schedule_popup, values=["scrape", "crawl"], state="readonly")
+    job_type_combobox.grid(row=6, column=1, padx=10, pady=10)
+    job_type_combobox.current(0)  # Set the default value to "scrape"
+
+    # Create and place the crawl filters: maximum link depth, allowed domains and a URL pattern
+    max_depth_label = ttk.Label(schedule_popup, text="Crawl Max Depth:")
+    max_depth_label.grid(row=7, column=0, padx=10, pady=10)
+
+    max_depth_entry = ttk.Entry(schedule_popup, width=10)  # Entry widget for the maximum link depth
+    max_depth_entry.insert(0, "2")
+    max_depth_entry.grid(row=7, column=1, padx=10, pady=10)
+
+    allowed_domains_label = ttk.Label(schedule_popup, text="Crawl Domains (comma-separated):")
+    allowed_domains_label.grid(row=8, column=0, padx=10, pady=10)
+
+    allowed_domains_entry = ttk.Entry(schedule_popup, width=30)  # Empty means the start URL's domain
+    allowed_domains_entry.grid(row=8, column=1, padx=10, pady=10)
+
+    url_pattern_label = ttk.Label(schedule_popup, text="Crawl URL Pattern (regex):")
+    url_pattern_label.grid(row=9, column=0, padx=10, pady=10)
+
+    url_pattern_entry = ttk.Entry(schedule_popup, width=30)  # Empty means every URL on the allowed domains
+    url_pattern_entry.grid(row=9, column=1, padx=10, pady=10)
+
+    # Create and place the table output combobox: append the tables found in each scan to CSV or Parquet files
+    table_format_label = ttk.Label(schedule_popup, text="Table Output:")
+    table_format_label.grid(row=10, column=0, padx=10, pady=10)
+
+    table_format_combobox = ttk.Combobox(schedule_popup, values=["none", "csv", "parquet"], state="readonly")
+    table_format_combobox.grid(row=10, column=1, padx=10, pady=10)
+    table_format_combobox.current(0)  # Set the default value to "none"
+
     # Create and place the overwrite checkbox to control file overwriting behavior
     overwrite_var = IntVar()  # Variable to track the state of the checkbox
     overwrite_checkbox = ttk.Checkbutton(schedule_popup, text="Overwrite Previous Scans", variable=overwrite_var)
-    overwrite_checkbox.grid(row=3, column=1, padx=10, pady=10)
+    overwrite_checkbox.grid(row=11, column=1, padx=10, pady=10)
+
+    # Create and place the checkbox to download the images found in each scan
+    download_images_var = IntVar()  # Variable to track the state of the checkbox
+    download_images_checkbox = ttk.Checkbutton(schedule_popup, text="Download Images", variable=download_images_var)
+    download_images_checkbox.grid(row=11, column=2, padx=10, pady=10)
 
     def schedule_and_close():
         """Schedule the scraping task based on user input and close the popup window."""
@@ -597,24 +1640,48 @@ def open_schedule_popup():
             unit = unit_combobox.get()  # Get the selected time unit
             job_name = job_name_entry.get()  # Get the job name from the entry field
             max_files = int(max_files_entry.get())  # Get the max files as an integer
+            cache_ttl = int(cache_ttl_entry.get()) if cache_ttl_entry.get() else None  # Optional cache lifetime
+            timeout = float(timeout_entry.get()) if timeout_entry.get() else None  # Optional request timeout
+            retries = int(retries_entry.get()) if retries_entry.get() else None  # Optional retry count
+            max_depth = int(max_depth_entry.get() or 2)  # Maximum link depth for crawl jobs
+            allowed_domains = [domain.strip().lower() for domain in allowed_domains_entry.get().split(",")
+                               if domain.strip()]
+            url_pattern = url_pattern_entry.get() or None
+            if url_pattern:
+                try:
+                    re.compile(url_pattern)
+                except re.error as e:
+                    messagebox.showerror("Error", f"Invalid crawl URL pattern: {e}")
+                    return
 
             if not job_name:  # If no job name is provided, display an error message
                 messagebox.showerror("Error", "Please enter a job name.")
                 return
+            if job_name == manual_downloads_job:  # Its folder holds the images downloaded from the main window
+                messagebox.showerror("Error", f"The job name '{manual_downloads_job}' is reserved for image downloads.")
+                return
 
-            os.makedirs(f"./{job_name}/active_scans",
+            os.makedirs(os.path.join(job_dir(job_name), "active_scans"),
                         exist_ok=True)  # Create the directory for the job if it doesn't exist
 
-            scans[job_name] = {"state": "Stopped"}  # Add the job to the scans dictionary
+            # Add the job to the scans dictionary, remembering what it scrapes so it does not depend on the main window
+            scans[job_name] = {"state": "Stopped", "url": url_entry.get(), "tag": tag_entry.get(),
+                               "cache_ttl": cache_ttl, "timeout": timeout, "retries": retries,
+                               "type": job_type_combobox.get(), "max_depth": max_depth,
+                               "allowed_domains": allowed_domains, "url_pattern": url_pattern,
+                               "table_format": None if table_format_combobox.get() == "none"
+                               else table_format_combobox.get(),
+                               "download_images": bool(download_images_var.get()), "max_files": max_files}
 
             # Only update the listbox if it has been initialized (i.e., if the window has been opened)
             if active_scans_listbox is not None:
                 update_active_scans_listbox()  # Update the active scans listbox
 
-            schedule_scraping(interval, unit)  # Schedule the scraping task
+            schedule_scraping(interval, unit, job_name)  # Schedule the scraping task
             schedule_popup.destroy()  # Close the popup window
         except ValueError:  # Handle any value errors (e.g., non-integer inputs)
-            messagebox.showerror("Error", "Please enter valid numbers for the interval and max files.")
+            messagebox.showerror("Error", "Please enter valid numbers for the interval, max files, cache TTL, "
+                                          "timeout, retries and crawl depth.")
 
 
 
@@ -624,35 +1691,521 @@ def open_schedule_popup():
 
     # Create and place the Schedule and Cancel buttons
     schedule_button = ttk.Button(schedule_popup, text="Schedule", command=schedule_and_close)
-    schedule_button.grid(row=4, column=1, padx=10, pady=10)
+    schedule_button.grid(row=12, column=1, padx=10, pady=10)
 
     cancel_button = ttk.Button(schedule_popup, text="Cancel", command=cancel_and_close)
-    cancel_button.grid(row=4, column=2, padx=10, pady=10)
+    cancel_button.grid(row=12, column=2, padx=10, pady=10)
+
+
+# Job File Functionality
+job_file_batch_size = 200  # Jobs registered per step while importing, so the window stays responsive
+job_definition_types = {  # Fields a job definition may contain and the types their values must have
+    'name': str, 'url': str, 'urls': list, 'tag': str, 'selector': str, 'interval': int, 'unit': str,
+    'type': str, 'cache_ttl': int, 'timeout': (int, float), 'retries': int, 'rate_limit': (int, float),
+    'max_depth': int, 'allowed_domains': list, 'url_pattern': str, 'max_pages_per_run': int,
+    'output_format': str, 'strip_tags': bool, 'table_format': str, 'download_images': bool, 'max_files': int,
+}
+job_definition_choices = {  # Fields restricted to a fixed set of values
+    'unit': ("seconds", "minutes", "hours", "days"), 'type': ("scrape", "crawl"),
+    'output_format': ("txt", "csv", "json"), 'table_format': ("csv", "parquet"),
+}
+
+
+def read_job_file(file_path):
+    """Read job definitions and host policies from a JSON, TOML or YAML file.
+
+    The file holds a list of jobs, or a mapping with a "jobs" list, optional "defaults" applied to every job and an
+    optional "hosts" mapping of host name to timeout, retries and rate_limit settings. Returns (jobs, hosts).
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    with open(file_path, 'rb') as file:
+        if extension == ".toml":
+            if tomllib is None:
+                raise ValueError("Reading TOML job files requires Python 3.11 or newer.")
+            data = tomllib.load(file)
+        elif extension in (".yaml", ".yml"):
+            if yaml is None:
+                raise ValueError("Reading YAML job files requires PyYAML (pip install pyyaml).")
+            data = yaml.safe_load(file)
+        else:
+            data = json.load(file)
+
+    if isinstance(data, list):
+        return data, {}
+    if isinstance(data, dict) and isinstance(data.get('jobs'), list):
+        defaults = data.get('defaults') or {}
+        if not isinstance(defaults, dict):
+            raise ValueError("'defaults' must be a mapping of job settings.")
+        hosts = data.get('hosts') or {}
+        if not isinstance(hosts, dict):
+            raise ValueError("'hosts' must map host names to their settings.")
+        return [dict(defaults, **job) if isinstance(job, dict) else job for job in data['jobs']], hosts
+    raise ValueError("A job file must contain a list of jobs or a 'jobs' list.")
+
+
+def validate_host_policy(host, policy):
+    """Return a list of problems with the settings of a host in a job file's "hosts" section."""
+    if not isinstance(policy, dict):
+        return [f"settings of host '{host}' must be a mapping"]
+    errors = []
+    for key, value in policy.items():
+        if key not in ('timeout', 'retries', 'rate_limit'):
+            errors.append(f"unknown field '{key}' for host '{host}'")
+        elif isinstance(value, bool) or not isinstance(value, int if key == 'retries' else (int, float)):
+            errors.append(f"'{key}' of host '{host}' has the wrong type")
+        elif value < 0 if key == 'retries' else value <= 0:
+            errors.append(f"'{key}' of host '{host}' must be {'zero or more' if key == 'retries' else 'positive'}")
+    return errors
+
+
+def validate_job_definition(definition):
+    """Return a list of problems with a job definition; an empty list means it is valid."""
+    if not isinstance(definition, dict):
+        return ["job definition must be a mapping"]
+
+    errors = []
+    for key, value in definition.items():
+        expected = job_definition_types.get(key)
+        if expected is None:  # Most likely a typo, which would otherwise be silently ignored
+            errors.append(f"unknown field '{key}'")
+        elif value is None:
+            continue
+        elif not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+            errors.append(f"'{key}' has the wrong type")
+        elif key in job_definition_choices and value is not None and value not in job_definition_choices[key]:
+            errors.append(f"'{key}' must be one of {', '.join(job_definition_choices[key])}")
+    if errors:
+        return errors
+
+    name = definition.get('name')
+    if not name or "/" in name or "\\" in name or name in (".", ".."):
+        errors.append("'name' is required and cannot contain path separators")
+    elif name == manual_downloads_job:  # Its folder holds the images downloaded from the main window
+        errors.append(f"'name' cannot be '{manual_downloads_job}', which is reserved for image downloads")
+
+    urls = definition.get('urls') or ([definition['url']] if definition.get('url') else [])
+    if not urls:
+        errors.append("'url' or 'urls' is required")
+    for url in urls:
+        if not isinstance(url, str) or urlparse(url).scheme not in ('http', 'https') or not urlparse(url).netloc:
+            errors.append(f"invalid URL {url!r}")
+
+    if not definition.get('tag') and not definition.get('selector'):
+        errors.append("'tag' or 'selector' is required")
+    if not definition.get('interval') or definition['interval'] <= 0:
+        errors.append("'interval' must be a positive number")
+    for key in ('cache_ttl', 'retries', 'max_depth', 'max_pages_per_run', 'max_files'):
+        if definition.get(key) is not None and definition[key] < 0:
+            errors.append(f"'{key}' cannot be negative")
+    for key in ('timeout', 'rate_limit'):  # Leave these out for the default timeout and no rate limit
+        if definition.get(key) is not None and definition[key] <= 0:
+            errors.append(f"'{key}' must be a positive number")
+    if not all(isinstance(domain, str) for domain in definition.get('allowed_domains') or []):
+        errors.append("'allowed_domains' must be a list of domain names")
+    if definition.get('url_pattern'):
+        try:
+            re.compile(definition['url_pattern'])
+        except re.error as e:
+            errors.append(f"invalid 'url_pattern': {e}")
+    return errors
+
+
+def expand_job_definition(definition):
+    """Turn a job definition into (job name, settings) pairs, one per URL of a url list."""
+    settings = {key: value for key, value in definition.items()
+                if key in job_config_keys and key != 'url' and value is not None}
+    urls = definition.get('urls') or [definition['url']]
+    if len(urls) == 1:
+        return [(definition['name'], dict(settings, url=urls[0]))]
+    return [(f"{definition['name']}_{index}", dict(settings, url=url)) for index, url in enumerate(urls, start=1)]
+
+
+def register_job(name, settings, interval, unit):
+    """Add or replace a job and schedule it."""
+    scan = scans.setdefault(name, {"state": "Stopped"})
+    for key in job_config_keys:  # Replace the job's settings, keeping its runtime state
+        scan.pop(key, None)
+    scan.update(settings)
+    schedule_scraping(interval, unit, name)
+
+
+def import_jobs():
+    """Import job definitions from a file, validating them first and scheduling them in batches."""
+    file_path = filedialog.askopenfilename(title="Import Jobs", filetypes=[
+        ("Job files", "*.json *.toml *.yaml *.yml"), ("All Files", "*.*")])
+    if not file_path:
+        return
+
+    try:
+        definitions, hosts = read_job_file(file_path)
+    except Exception as e:  # Handle unreadable files and JSON, TOML or YAML syntax errors
+        messagebox.showerror("Error", f"Failed to read the job file: {e}")
+        return
+
+    # Validate everything before scheduling anything, so a bad file does not leave a half-imported set of jobs
+    errors = [f"Hosts: {problem}" for host, policy in hosts.items() for problem in validate_host_policy(host, policy)]
+    names = set()
+    jobs = []
+    for index, definition in enumerate(definitions, start=1):
+        problems = validate_job_definition(definition)
+        if not problems:
+            for name, settings in expand_job_definition(definition):
+                if name in names:
+                    problems.append(f"duplicate job name '{name}'")
+                names.add(name)
+                jobs.append((name, settings, definition['interval'], definition.get('unit', "minutes")))
+        label = definition.get('name') if isinstance(definition, dict) and definition.get('name') else f"#{index}"
+        errors.extend(f"Job {label}: {problem}" for problem in problems)
+
+    if errors:
+        shown = "\n".join(errors[:20]) + (f"\n... and {len(errors) - 20} more" if len(errors) > 20 else "")
+        messagebox.showerror("Invalid Job File", f"No jobs were imported.\n\n{shown}")
+        return
+
+    for host, policy in hosts.items():  # Host settings apply to every job that fetches from the host
+        host_policies[host.lower()] = dict(policy)
+
+    def register_batch(start):
+        """Register the next batch of jobs, then yield to the event loop before the following one."""
+        for name, settings, interval, unit in jobs[start:start + job_file_batch_size]:
+            register_job(name, settings, interval, unit)
+        if start + job_file_batch_size < len(jobs):
+            root.after(1, register_batch, start + job_file_batch_size)
+        else:
+            if active_scans_listbox is not None:
+                update_active_scans_listbox()
+            messagebox.showinfo("Jobs Imported", f"{len(jobs)} jobs imported and scheduled.")
+
+    register_batch(0)
+
+
+def export_jobs():
+    """Export every job with its schedule to a JSON or YAML job file that can be imported again."""
+    definitions = []
+    for name in scans:
+        if not scans[name].get('url'):  # Skip entries that do not describe a complete job
+            continue
+        definition = {'name': name}
+        definition.update(job_config(name))
+        definition['interval'] = scans[name].get('interval')
+        definition['unit'] = scans[name].get('unit')
+        definitions.append({key: value for key, value in definition.items() if value is not None})
+
+    if not definitions:
+        messagebox.showerror("Error", "No jobs to export.")
+        return
+    data = {'hosts': host_policies, 'jobs': definitions} if host_policies else {'jobs': definitions}
+
+    file_path = filedialog.asksaveasfilename(title="Export Jobs", defaultextension=".json",
+                                             filetypes=[("JSON", "*.json"), ("YAML", "*.yaml *.yml")])
+    if not file_path:
+        return
+
+    try:
+        with open(file_path, 'w', encoding='utf-8') as file:
+            if os.path.splitext(file_path)[1].lower() in (".yaml", ".yml"):
+                if yaml is None:
+                    raise ValueError("Writing YAML job files requires PyYAML (pip install pyyaml).")
+                yaml.safe_dump(data, file, sort_keys=False)
+            else:
+                json.dump(data, file, indent=2)
+        messagebox.showinfo("Success", f"{len(definitions)} jobs exported.")
+    except (OSError, ValueError) as e:
+        messagebox.showerror("Error", f"Failed to export the jobs: {e}")
 
 
 # Scheduling Functionality
-def schedule_scraping(interval, unit):
+def submit_job(job):
+    """Hand a scheduled job to the worker pool so that a slow host cannot hold up the scheduler thread."""
+    if job_queue_path:  # Distributed mode: leave the work to whichever worker leases it
+        try:
+            enqueue_job(job)
+        except sqlite3.Error as e:
+            report_scrape_error(job, f"Failed to queue the job: {e}")
+        return
+
+    scan = scans.get(job, {})
+    if scan.get('in_progress'):  # The previous run of this job has not finished yet; skip this one
+        return
+    scan['in_progress'] = True
+
+    def run_job():
+        try:
+            if scan.get('type') == 'crawl':  # Crawl jobs follow links from page to page
+                crawl(job)
+            elif not pause_flag:
+                scrape_job(job)
+        except Exception as e:  # Keep the worker alive and record unexpected errors with the job
+            report_scrape_error(job, f"Scrape failed: {e}")
+        finally:
+            scan['in_progress'] = False
+
+    job_executor.submit(run_job)
+
+
+def schedule_scraping(interval, unit, job=None):
     """Schedule the scraping task at the specified interval and time unit."""
+    global scheduler_thread
+    if job:  # Replace any earlier schedule of the same job
+        schedule.clear(job)
+        scans.setdefault(job, {"state": "Stopped"}).update(interval=interval, unit=unit)
     if unit == "seconds":
-        schedule.every(interval).seconds.do(scrape)
+        schedule.every(interval).seconds.do(submit_job, job).tag(job)
     elif unit == "minutes":
-        schedule.every(interval).minutes.do(scrape)
+        schedule.every(interval).minutes.do(submit_job, job).tag(job)
     elif unit == "hours":
-        schedule.every(interval).hours.do(scrape)
+        schedule.every(interval).hours.do(submit_job, job).tag(job)
     elif unit == "days":
-        schedule.every(interval).days.do(scrape)
+        schedule.every(interval).days.do(submit_job, job).tag(job)
 
-    # Run the scheduling in a separate thread to avoid blocking the main GUI thread
-    threading.Thread(target=run_scheduler).start()
+    # Run the scheduling in a separate thread to avoid blocking the main GUI thread; one thread serves every job
+    if scheduler_thread is None or not scheduler_thread.is_alive():
+        scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
+        scheduler_thread.start()
 
 
 def run_scheduler():
     """Continuously run the scheduled tasks."""
     while True:  # Run indefinitely
         schedule.run_pending()  # Execute any pending tasks
+        if job_queue_path:  # Pick up what the workers reported back
+            try:
+                collect_queue_results()
+            except sqlite3.Error as e:
+                print(f"Failed to read the job queue: {e}")
+        save_response_cache_index()  # Write batched cache index changes once the flush interval has passed
         time.sleep(1)  # Sleep for 1 second before checking again
 
 
+# Distributed Worker Functionality
+def open_job_queue(path):
+    """Open the shared job queue, creating its table on first use."""
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)  # Transactions are managed explicitly
+    conn.execute("""CREATE TABLE IF NOT EXISTS job_queue (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        job TEXT NOT NULL,
+                        config TEXT NOT NULL,
+                        status TEXT NOT NULL DEFAULT 'pending',
+                        worker TEXT,
+                        lease_expires REAL,
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        enqueued_at REAL NOT NULL,
+                        finished_at REAL,
+                        error TEXT,
+                        reported INTEGER NOT NULL DEFAULT 0)""")
+    conn.execute("CREATE INDEX IF NOT EXISTS job_queue_status ON job_queue (status, id)")
+    return conn
+
+
+def job_config(job):
+    """Return the settings that describe a job, ready to be serialised."""
+    scan = scans.get(job, {})
+    config = {key: scan[key] for key in job_config_keys if scan.get(key) is not None}
+    # Pin the output settings so that workers save snapshots the way this window is set up
+    file_ext, strip_tags = job_output_settings(job)
+    config['output_format'], config['strip_tags'] = file_ext.lstrip("."), strip_tags
+    return config
+
+
+def enqueue_job(job):
+    """Add a run of a job to the shared queue, unless a run of it is already waiting or in progress."""
+    conn = open_job_queue(job_queue_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")  # Take the write lock so two coordinators cannot queue the same run
+    except sqlite3.Error:
+        conn.close()
+        raise
+    try:
+        queued = conn.execute("SELECT 1 FROM job_queue WHERE job = ? AND status IN ('pending', 'leased')",
+                              (job,)).fetchone()
+        if not queued:
+            config = dict(job_config(job), hosts=host_policies)  # Workers apply the same per-host settings
+            conn.execute("INSERT INTO job_queue (job, config, enqueued_at) VALUES (?, ?, ?)",
+                         (job, json.dumps(config), time.time()))
+        conn.execute("COMMIT")
+    except sqlite3.Error:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def lease_job(conn, worker):
+    """Lease the oldest waiting job to a worker, first reclaiming leases whose workers stopped sending heartbeats.
+
+    Returns (id, job, config) or None when the queue is empty.
+    """
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")  # Take the write lock so two workers cannot lease the same job
+    try:
+        # Jobs whose worker went silent go back to the queue, or fail once they have used up their attempts
+        conn.execute("UPDATE job_queue SET status = 'failed', finished_at = ?, error = 'Lease expired too often' "
+                     "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?", (now, now, max_job_attempts))
+        conn.execute("UPDATE job_queue SET status = 'pending', worker = NULL "
+                     "WHERE status = 'leased' AND lease_expires < ?", (now,))
+
+        row = conn.execute("SELECT id, job, config FROM job_queue WHERE status = 'pending' "
+                           "ORDER BY id LIMIT 1").fetchone()
+        if row:
+            conn.execute("UPDATE job_queue SET status = 'leased', worker = ?, lease_expires = ?, "
+                         "attempts = attempts + 1 WHERE id = ?", (worker, now + lease_seconds, row[0]))
+        conn.execute("COMMIT")
+    except sqlite3.Error:
+        conn.execute("ROLLBACK")
+        raise
+    return (row[0], row[1], json.loads(row[2])) if row else None
+
+
+def renew_lease(conn, lease_id, worker):
+    """Extend a worker's lease on a job; returns False if the lease has already been given to another worker."""
+    cursor = conn.execute("UPDATE job_queue SET lease_expires = ? WHERE id = ? AND worker = ? AND status = 'leased'",
+                          (time.time() + lease_seconds, lease_id, worker))
+    return cursor.rowcount == 1
+
+
+def finish_job(conn, lease_id, worker, error=None):
+    """Mark a leased job as done, or as failed with the given error."""
+    conn.execute("UPDATE job_queue SET status = ?, finished_at = ?, error = ? "
+                 "WHERE id = ? AND worker = ? AND status = 'leased'",
+                 ('failed' if error else 'done', time.time(), error, lease_id, worker))
+
+
+def collect_queue_results():
+    """Copy the outcome of finished queued runs into the coordinator's job state."""
+    conn = open_job_queue(job_queue_path)
+    try:
+        rows = conn.execute("SELECT id, job, status, finished_at, error, worker FROM job_queue "
+                            "WHERE status IN ('done', 'failed') AND reported = 0 ORDER BY id").fetchall()
+        for lease_id, job, status, finished_at, error, worker in rows:
+            finished = datetime.fromtimestamp(finished_at).strftime("%Y-%m-%d %H:%M:%S")
+            scan = scans.setdefault(job, {"state": "Stopped"})
+            if status == 'done':
+                scan['last_success_at'] = finished
+                scan['consecutive_failures'] = 0
+            else:
+                scan['last_error'] = f"{error} (worker {worker})"
+                scan['last_error_at'] = finished
+                scan['consecutive_failures'] = scan.get('consecutive_failures', 0) + 1
+            conn.execute("UPDATE job_queue SET reported = 1 WHERE id = ?", (lease_id,))
+
+        # Remove collected runs once they are older than the retention window, so the queue does not grow forever
+        global queue_last_purge
+        if time.time() - queue_last_purge >= 3600:
+            conn.execute("DELETE FROM job_queue WHERE reported = 1 AND finished_at < ?",
+                         (time.time() - queue_retention,))
+            queue_last_purge = time.time()
+    finally:
+        conn.close()
+
+
+def run_queued_job(job):
+    """Run a job leased from the queue without the GUI, saving its results into the job's snapshot store."""
+    if scans[job].get('type') == 'crawl':
+        crawl(job)
+    else:
+        scrape_job(job)
+
+
+def run_worker(queue_path, worker=None):
+    """Lease jobs from the shared queue and run them until interrupted."""
+    worker = worker or worker_id
+    conn = open_job_queue(queue_path)
+    unfinished = []  # (lease id, error) of runs whose outcome could not be written to the queue yet
+    print(f"Worker {worker} waiting for jobs in {queue_path}")
+    while True:
+        # A busy or briefly unreachable queue (e.g. on a network volume) is retried on the next poll
+        try:
+            conn = conn or open_job_queue(queue_path)
+            while unfinished:
+                lease_id, error = unfinished[0]
+                finish_job(conn, lease_id, worker, error)
+                unfinished.pop(0)
+            lease = lease_job(conn, worker)
+        except sqlite3.Error as e:
+            print(f"Worker {worker} could not use the job queue: {e}")
+            if conn:
+                conn.close()
+            conn = None  # Reconnect on the next poll
+            time.sleep(worker_poll_interval)
+            continue
+        if lease is None:  # Nothing to do yet
+            save_response_cache_index()  # Write batched cache index changes while idle
+            time.sleep(worker_poll_interval)
+            continue
+
+        lease_id, job, config = lease
+        host_policies.update(config.pop('hosts', {}))
+        scans[job] = dict(config, state="Running", consecutive_failures=0)
+        print(f"Worker {worker} running {job}")
+
+        # Keep the lease alive from a separate thread while the job runs
+        done = threading.Event()
+
+        def heartbeat():
+            heartbeat_conn = None
+            try:
+                while not done.wait(heartbeat_interval):
+                    try:
+                        heartbeat_conn = heartbeat_conn or open_job_queue(queue_path)
+                        if not renew_lease(heartbeat_conn, lease_id, worker):
+                            print(f"Worker {worker} lost its lease on {job}")
+                            return
+                    except sqlite3.Error as e:  # Try again at the next heartbeat, before the lease runs out
+                        print(f"Worker {worker} could not renew its lease on {job}: {e}")
+            finally:
+                if heartbeat_conn:
+                    heartbeat_conn.close()
+
+        heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+        heartbeat_thread.start()
+        try:
+            run_queued_job(job)
+            error = scans[job].get('last_error') if scans[job].get('consecutive_failures') else None
+        except Exception as e:  # Report unexpected errors instead of taking the worker down
+            error = f"Job failed: {e}"
+        finally:
+            done.set()
+            heartbeat_thread.join()
+        unfinished.append((lease_id, error))  # Written to the queue at the top of the loop
+
+
+def toggle_job_queue():
+    """Switch between running scheduled jobs locally and handing them to workers through a shared queue."""
+    global job_queue_path, data_dir
+    if job_queue_path:
+        job_queue_path = None
+        data_dir = "."  # Back to job folders in the working directory
+    else:
+        path = filedialog.asksaveasfilename(title="Shared job queue", defaultextension=".db",
+                                            filetypes=[("SQLite database", "*.db")], confirmoverwrite=False)
+        if not path:
+            return
+        try:
+            open_job_queue(path).close()
+        except sqlite3.Error as e:
+            messagebox.showerror("Error", f"Failed to open the job queue: {e}")
+            return
+        job_queue_path = path
+        data_dir = os.path.dirname(os.path.abspath(path))  # Read and write job folders where the workers do
+    job_queue_button.config(text=f"Shared Queue: {'On' if job_queue_path else 'Off'}")
+
+
+# Worker mode: run headless, leasing jobs from a shared queue, e.g. "python primary.py --worker /shared/queue.db"
+if __name__ == "__main__" and "--worker" in sys.argv:
+    parser = argparse.ArgumentParser(description="Run Simple Web Scraper as a distributed worker.")
+    parser.add_argument("--worker", metavar="QUEUE", required=True, help="path of the shared job queue database")
+    parser.add_argument("--data-dir",
+                        help="directory holding the job folders, if the queue's directory is mounted elsewhere")
+    args = parser.parse_args()
+    queue_path = os.path.abspath(args.worker)
+    data_dir = args.data_dir or os.path.dirname(queue_path)  # Job folders live next to the queue, as on the coordinator
+    load_response_cache()
+    run_worker(queue_path)
+
+
+# Load the response cache index left by previous runs
+load_response_cache()
+
 # Set up the GUI
 root = tk.Tk()  # Create the main application window
 root.title("Simple Web Scraper")  # Set the window title
@@ -686,6 +2239,12 @@ schedule_window_button.grid(row=0, column=1, padx=3)
 pause_button = ttk.Button(button_frame, text="Pause Active Scans", command=lambda: pause_active_scans(selected_scan))
 pause_button.grid(row=0, column=2, padx=3)
 
+import_jobs_button = ttk.Button(button_frame, text="Import Jobs", command=import_jobs)
+import_jobs_button.grid(row=0, column=3, padx=3)
+
+export_jobs_button = ttk.Button(button_frame, text="Export Jobs", command=export_jobs)
+export_jobs_button.grid(row=0, column=4, padx=3)
+
 # Additional Button Frame: contains Highlight Differences, Hotkeys, Set Custom Hotkeys
 additional_button_frame = ttk.Frame(root)
 additional_button_frame.pack(pady=3)
@@ -700,6 +2259,9 @@ hotkeys_button.grid(row=0, column=1, padx=3)
 custom_hotkeys_button = ttk.Button(additional_button_frame, text="Set Custom Hotkeys", command=set_custom_hotkeys)
 custom_hotkeys_button.grid(row=0, column=2, padx=3)
 
+job_queue_button = ttk.Button(additional_button_frame, text="Shared Queue: Off", command=toggle_job_queue)
+job_queue_button.grid(row=0, column=3, padx=3)
+
 # Action Button Frame: contains ?, Scrape, Clear Text Area
 action_button_frame = ttk.Frame(root)
 action_button_frame.pack(pady=5)
@@ -808,6 +2370,9 @@ parse_images_button.grid(row=0, column=2, padx=5)
 parse_tables_button = ttk.Button(parse_button_frame, text="Parse Tables", command=lambda: parse_data("tables"))
 parse_tables_button.grid(row=0, column=3, padx=5)
 
+download_images_button = ttk.Button(parse_button_frame, text="Download Images", command=download_images)
+download_images_button.grid(row=0, column=4, padx=5)
+
 # Bind key press event to trigger actions via hotkeys
 root.bind("<Key>", on_key_press)
 